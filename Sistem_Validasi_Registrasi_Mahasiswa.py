@@ -1,6 +1,10 @@
 import logging
-from dataclasses import dataclass
-from typing import List, Tuple
+import sys
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
 from abc import ABC, abstractmethod
 
 # -------------------------
@@ -18,19 +22,96 @@ logger = logging.getLogger(__name__)
 # -------------------------
 ScheduleEntry = Tuple[str, int, int]  # (day, start_minute, end_minute)
 
-@dataclass
+MINUTES_PER_DAY = 24 * 60
+# Urutan hari untuk encoding jadwal; nama hari lain mendapat indeks baru
+# saat pertama kali dipakai (lihat day_index)
+DAY_INDEX = {"Senin": 0, "Selasa": 1, "Rabu": 2, "Kamis": 3, "Jumat": 4, "Sabtu": 5, "Minggu": 6}
+
+def day_index(day: str) -> int:
+    """Helper untuk indeks hari pada encoding; hari yang belum dikenal ditambahkan ke DAY_INDEX."""
+    return DAY_INDEX.setdefault(day, len(DAY_INDEX))
+
+def encode_schedule(schedule: Sequence[ScheduleEntry]) -> Tuple[array, array]:
+    """
+    Mengubah jadwal menjadi dua array paralel (starts, ends) berisi menit sejak
+    Senin 00:00, yaitu hari*1440 + menit. Karena setiap slot berada dalam satu
+    hari, slot di hari berbeda tidak pernah beririsan, sehingga perbandingan
+    cukup dengan satu bilangan bulat.
+
+    Args:
+        schedule (Sequence[ScheduleEntry]): Daftar (hari, menit_mulai, menit_selesai).
+
+    Returns:
+        Tuple[array, array]: Array starts dan ends ter-encode, sesuai urutan jadwal.
+
+    Raises:
+        ValueError: Jika ada slot di luar 0 <= menit_mulai < menit_selesai <= 1440,
+                    yaitu slot kosong/terbalik atau yang melewati pergantian hari.
+    """
+    starts, ends = array("i"), array("i")
+    for (day, s, e) in schedule:
+        if not 0 <= s < e <= MINUTES_PER_DAY:
+            raise ValueError(f"Rentang waktu tidak valid pada {day}: {s}-{e}")
+        offset = day_index(day) * MINUTES_PER_DAY
+        starts.append(offset + s)
+        ends.append(offset + e)
+    return starts, ends
+
+def schedule_mask(starts: array, ends: array) -> int:
+    """
+    Mengubah jadwal ter-encode (lihat encode_schedule) menjadi bitmask: bit
+    ke-(hari*1440 + menit) bernilai 1 jika menit tersebut terpakai.
+    """
+    mask = 0
+    for i in range(len(starts)):
+        mask |= ((1 << (ends[i] - starts[i])) - 1) << starts[i]
+    return mask
+
+@dataclass(slots=True, frozen=True)
 class Course:
     code: str
     name: str
     sks: int
-    prerequisites: List[str]
-    schedule: List[ScheduleEntry]
-
-@dataclass
+    prerequisites: Tuple[str, ...]
+    schedule: Tuple[ScheduleEntry, ...]
+    # Nilai turunan dari schedule, tidak ikut dibandingkan maupun di-hash
+    starts: array = field(init=False, repr=False, compare=False)
+    ends: array = field(init=False, repr=False, compare=False)
+    schedule_mask: int = field(init=False, repr=False, compare=False)
+    has_self_overlap: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # List dari pemanggil diubah menjadi tuple agar Course benar-benar immutable.
+        # Intern string agar perbandingan kode/hari cukup lewat identitas objek
+        object.__setattr__(self, "code", sys.intern(self.code))
+        object.__setattr__(self, "prerequisites", tuple(sys.intern(p) for p in self.prerequisites))
+        object.__setattr__(self, "schedule", tuple((sys.intern(d), s, e) for (d, s, e) in self.schedule))
+        # schedule tetap disimpan untuk tampilan; starts/ends dipakai saat validasi
+        starts, ends = encode_schedule(self.schedule)
+        object.__setattr__(self, "starts", starts)
+        object.__setattr__(self, "ends", ends)
+        mask = schedule_mask(starts, ends)
+        object.__setattr__(self, "schedule_mask", mask)
+        # Jika jumlah bit lebih kecil dari total menit, ada slot yang saling beririsan
+        total_minutes = sum(ends[i] - starts[i] for i in range(len(starts)))
+        object.__setattr__(self, "has_self_overlap", bin(mask).count("1") != total_minutes)
+
+@dataclass(slots=True, frozen=True)
 class Registration:
     student_name: str
-    completed_courses: List[str]
-    selected_courses: List[Course]
+    completed_courses: Tuple[str, ...]
+    selected_courses: Tuple[Course, ...]
+    total_sks: int = field(init=False, repr=False, compare=False)
+    completed_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Kedua daftar disimpan sebagai tuple dan Registration dibekukan agar
+        # total_sks dan completed_set tidak bisa basi; untuk mengubah pilihan,
+        # buat Registration baru
+        object.__setattr__(self, "completed_courses", tuple(sys.intern(c) for c in self.completed_courses))
+        object.__setattr__(self, "selected_courses", tuple(self.selected_courses))
+        object.__setattr__(self, "total_sks", sum(c.sks for c in self.selected_courses))
+        object.__setattr__(self, "completed_set", frozenset(self.completed_courses))
 
 # -------------------------
 # Abstraksi: Validation Rule
@@ -56,6 +137,14 @@ class IValidationRule(ABC):
         """
         pass
 
+    @property
+    def estimated_cost(self) -> int:
+        """
+        Perkiraan biaya relatif menjalankan rule ini (semakin kecil semakin murah).
+        RegistrationService menjalankan rule termurah lebih dulu.
+        """
+        return 10
+
 # -------------------------
 # Implementasi Rule
 # -------------------------
@@ -73,6 +162,10 @@ class SksLimitRule(IValidationRule):
         """
         self.max_sks = max_sks
 
+    @property
+    def estimated_cost(self) -> int:
+        return 1
+
     def validate(self, registration: Registration) -> Tuple[bool, str]:
         """
         Memeriksa apakah total SKS dari mata kuliah yang dipilih melebihi batas.
@@ -84,11 +177,12 @@ class SksLimitRule(IValidationRule):
             Tuple[bool, str]: (False, Pesan Error) jika melebihi batas, 
                               (True, "SKS OK") jika aman.
         """
-        total = sum(c.sks for c in registration.selected_courses)
-        logger.info(f"Memeriksa total SKS: {total}/{self.max_sks}")
+        total = registration.total_sks
+        max_sks = self.max_sks
+        logger.info("Memeriksa total SKS: %d/%d", total, max_sks)
         
-        if total > self.max_sks:
-            msg = f"Total SKS ({total}) melebihi batas maksimum ({self.max_sks})."
+        if total > max_sks:
+            msg = f"Total SKS ({total}) melebihi batas maksimum ({max_sks})."
             logger.warning(msg)
             return False, msg
         
@@ -112,28 +206,56 @@ class PrerequisiteRule(IValidationRule):
                               (True, "Prasyarat OK") jika sukses.
         """
         missing = []
-        completed = set(registration.completed_courses)
+        completed = registration.completed_set
         
         logger.info("Memeriksa prasyarat mata kuliah...")
+
+        # Jalur cepat: semua prasyarat terpenuhi, tidak perlu detail per mata kuliah
+        all_required = set().union(*(c.prerequisites for c in registration.selected_courses))
+        if completed >= all_required:
+            return True, "Prasyarat OK."
         
+        missing_append = missing.append
+        completed_contains = completed.__contains__
         for course in registration.selected_courses:
-            for pre in course.prerequisites:
-                if pre not in completed:
-                    missing.append((course.code, pre))
+            prerequisites = course.prerequisites
+            if completed.issuperset(prerequisites):
+                continue
+            code = course.code
+            for pre in prerequisites:
+                if not completed_contains(pre):
+                    missing_append(f"{code} butuh {pre}")
         
         if missing:
-            msgs = [f"{c} butuh {p}" for c, p in missing]
-            full_msg = "Prasyarat tidak terpenuhi: " + ", ".join(msgs)
+            full_msg = "Prasyarat tidak terpenuhi: " + ", ".join(missing)
             logger.warning(full_msg)
             return False, full_msg
         
         return True, "Prasyarat OK."
 
+# (kode_i, start_i, end_i, kode_j, start_j, end_j) dari dua jadwal yang bentrok
+Conflict = Tuple[str, int, int, str, int, int]
+
 class JadwalBentrokRule(IValidationRule):
     """
     Aturan validasi untuk mendeteksi jadwal bentrok antar mata kuliah.
     """
 
+    def __init__(self, use_numba: bool = False):
+        """
+        Inisialisasi rule jadwal bentrok.
+
+        Args:
+            use_numba (bool): Gunakan kernel Numba jika paket numba terinstal.
+                              Hanya menguntungkan untuk jadwal yang sangat banyak;
+                              jika tidak tersedia, otomatis memakai versi Python.
+        """
+        self.use_numba = use_numba
+
+    @property
+    def estimated_cost(self) -> int:
+        return 100
+
     def validate(self, registration: Registration) -> Tuple[bool, str]:
         """
         Memeriksa apakah ada irisan waktu (bentrok) antara jadwal 
@@ -146,38 +268,131 @@ class JadwalBentrokRule(IValidationRule):
             Tuple[bool, str]: (False, Detail Bentrok) jika ada jadwal tumpang tindih,
                               (True, "Tidak ada jadwal bentrok") jika aman.
         """
-        entries = []  # (day, start, end, course_code)
-        
         logger.info("Memeriksa bentrok jadwal...")
 
-        for course in registration.selected_courses:
-            for (day, s, e) in course.schedule:
-                entries.append((day, s, e, course.code))
-        
-        for i in range(len(entries)):
-            day_i, s_i, e_i, c_i = entries[i]
-            for j in range(i+1, len(entries)):
-                day_j, s_j, e_j, c_j = entries[j]
-                
-                if day_i != day_j:
-                    continue
-                
-                # Cek overlap waktu
-                if s_i < e_j and s_j < e_i:
-                    start_str = format_time(s_i)
-                    end_str = format_time(e_i)
-                    start_j_str = format_time(s_j)
-                    end_j_str = format_time(e_j)
-                    
-                    msg = (f"Jadwal bentrok antara {c_i} ({start_str}-{end_str}) "
-                           f"dan {c_j} ({start_j_str}-{end_j_str})")
-                    logger.warning(msg)
-                    return False, msg
+        kernel = _load_numba_kernel() if self.use_numba else None
+        if kernel is not None:
+            conflict = self._find_conflict_numba(registration, kernel)
+        else:
+            conflict = self._find_conflict_mask(registration)
+
+        if conflict is not None:
+            c_i, s_i, e_i, c_j, s_j, e_j = conflict
+            msg = (f"Jadwal bentrok antara {c_i} ({format_time(s_i)}-{format_time(e_i)}) "
+                   f"dan {c_j} ({format_time(s_j)}-{format_time(e_j)})")
+            logger.warning(msg)
+            return False, msg
                     
         return True, "Tidak ada jadwal bentrok."
 
+    @staticmethod
+    def _find_conflict_mask(registration: Registration) -> Optional[Conflict]:
+        """Deteksi bentrok dengan AND antar bitmask jadwal mingguan."""
+        taken = 0
+
+        for course in registration.selected_courses:
+            mask = course.schedule_mask
+            if taken & mask or course.has_self_overlap:
+                # Jalur lambat: cari pasangan jadwal yang bentrok untuk pesan error
+                return _first_conflict(registration.selected_courses)
+            taken |= mask
+
+        return None
+
+    @staticmethod
+    def _find_conflict_numba(registration: Registration, kernel) -> Optional[Conflict]:
+        """Deteksi bentrok dengan kernel Numba di atas array paralel (SoA)."""
+        import numpy as np
+
+        starts, ends = array("i"), array("i")
+        for course in registration.selected_courses:
+            starts.extend(course.starts)
+            ends.extend(course.ends)
+
+        # np.frombuffer membaca array.array tanpa menyalin data
+        if not starts or not kernel(np.frombuffer(starts, dtype=np.intc),
+                                    np.frombuffer(ends, dtype=np.intc)):
+            return None
+        # Kernel hanya menjawab ada/tidaknya bentrok; pasangan untuk pesan dicari
+        # dengan versi Python agar pesan tidak bergantung pada terinstalnya numba
+        return _first_conflict(registration.selected_courses)
+
+def _has_overlap(starts, ends) -> bool:
+    """
+    Kernel deteksi bentrok untuk Numba (lihat _load_numba_kernel): urutkan slot
+    ter-encode berdasarkan waktu mulai, lalu sweep sekali sambil menyimpan slot
+    dengan waktu selesai terbesar. Argumen berupa array NumPy dengan panjang sama.
+    """
+    order = starts.argsort(kind="mergesort")
+    prev = order[0]
+    for k in range(1, order.size):
+        cur = order[k]
+        if starts[cur] < ends[prev]:
+            return True
+        if ends[cur] > ends[prev]:
+            prev = cur
+    return False
+
+_numba_kernel = None
+
+def _load_numba_kernel():
+    """
+    Meng-import numba secara lazy dan meng-compile _has_overlap saat pertama
+    kali dibutuhkan. Mengembalikan None jika numba tidak terinstal.
+    """
+    global _numba_kernel
+    if _numba_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _numba_kernel = False
+            return None
+        _numba_kernel = njit(cache=True)(_has_overlap)
+    return _numba_kernel or None
+
+def _first_conflict(courses: Sequence[Course]) -> Optional[Conflict]:
+    """
+    Helper untuk mencari pasangan jadwal bentrok pertama sesuai urutan mata kuliah.
+    Jadwal yang sudah diambil (ter-encode, lihat encode_schedule) disimpan terurut,
+    sehingga setiap slot baru cukup dibandingkan dengan tetangga kiri dan kanannya
+    (bisect). Pesan memakai menit asli dari schedule, bukan nilai ter-encode.
+    """
+    # List paralel yang terurut berdasarkan taken_starts; taken_courses dan
+    # taken_slots menunjuk ke entri schedule asli untuk pesan
+    taken_starts: List[int] = []
+    taken_ends: List[int] = []
+    taken_courses: List[Course] = []
+    taken_slots: List[int] = []
+
+    for course in courses:
+        starts, ends = course.starts, course.ends
+        for k in range(len(starts)):
+            s, e = starts[k], ends[k]
+            i = bisect_left(taken_starts, s)
+            if i > 0 and taken_ends[i - 1] > s:
+                i -= 1
+            elif not (i < len(taken_starts) and taken_starts[i] < e):
+                # Slot langsung disisipkan, sehingga irisan antar slot dari mata
+                # kuliah yang sama juga terdeteksi dan taken_* tidak pernah beririsan
+                taken_starts.insert(i, s)
+                taken_ends.insert(i, e)
+                taken_courses.insert(i, course)
+                taken_slots.insert(i, k)
+                continue
+            other = taken_courses[i]
+            _, other_s, other_e = other.schedule[taken_slots[i]]
+            _, s_raw, e_raw = course.schedule[k]
+            return (other.code, other_s, other_e, course.code, s_raw, e_raw)
+
+    return None
+
+# Tabel "HH:MM" untuk setiap menit dalam sehari, dibangun sekali saat modul dimuat
+_TIME_CACHE = [f"{m // 60:02d}:{m % 60:02d}" for m in range(MINUTES_PER_DAY)]
+
 def format_time(minutes: int) -> str:
     """Helper untuk format menit ke HH:MM."""
+    if 0 <= minutes < MINUTES_PER_DAY:
+        return _TIME_CACHE[minutes]
     h = minutes // 60
     m = minutes % 60
     return f"{h:02d}:{m:02d}"
@@ -191,40 +406,161 @@ class RegistrationService:
     Menggunakan Dependency Injection untuk menerima daftar aturan validasi.
     """
 
-    def __init__(self, rules: List[IValidationRule]):
+    def __init__(self, rules: List[IValidationRule], cache_size: int = 0):
         """
         Inisialisasi RegistrationService.
 
         Args:
             rules (List[IValidationRule]): Daftar aturan validasi yang akan diterapkan.
+                                           Disalin sebagai tuple yang diurutkan berdasarkan
+                                           estimated_cost (urutan asli dipertahankan untuk
+                                           biaya yang sama), sehingga pesan error mengikuti
+                                           urutan tersebut.
+            cache_size (int): Jumlah maksimum hasil validasi yang disimpan (LRU).
+                              Default 0 (cache mati). Aktifkan hanya jika rules dan
+                              konfigurasinya tidak diubah setelah service dibuat;
+                              jika diubah, panggil clear_cache().
         """
-        self.rules = rules
+        self.rules: Tuple[IValidationRule, ...] = tuple(sorted(rules, key=lambda rule: rule.estimated_cost))
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Tuple[FrozenSet[str], Tuple[Course, ...], bool],
+                                 Tuple[bool, Tuple[str, ...]]] = OrderedDict()
 
-    def run_registration(self, registration: Registration) -> Tuple[bool, List[str]]:
+    def clear_cache(self):
+        """Menghapus hasil validasi tersimpan, misalnya setelah rules diubah."""
+        self._cache.clear()
+
+    def run_registration(self, registration: Registration,
+                         fail_fast: bool = False) -> Tuple[bool, List[str]]:
         """
         Menjalankan semua validasi terhadap data pendaftaran.
 
+        Jika cache aktif (cache_size > 0), hasil disimpan berdasarkan isi
+        pendaftaran: mata kuliah yang sudah lulus dan isi lengkap setiap Course
+        yang dipilih sesuai urutannya. Validasi ulang untuk isi yang sama tidak
+        menjalankan rules lagi, sehingga log "Memeriksa ..." dan peringatan dari
+        setiap rule tidak muncul.
+
         Args:
             registration (Registration): Objek data pendaftaran.
+            fail_fast (bool): Jika True, berhenti pada rule pertama yang gagal
+                              sehingga hanya satu pesan error yang dikembalikan.
 
         Returns:
             Tuple[bool, List[str]]: (True, Success Messages) jika semua lolos,
                                     (False, Error Messages) jika ada satu saja yang gagal.
         """
-        logger.info(f"Memulai validasi pendaftaran untuk: {registration.student_name}")
-        
-        errors = []
+        return self._run(registration, fail_fast)
+
+    def run_batch(self, registrations: Iterable[Registration],
+                  fail_fast: bool = False) -> List[Tuple[bool, List[str]]]:
+        """
+        Memvalidasi banyak pendaftaran sekaligus (misalnya saat pembukaan KRS),
+        satu per satu dengan cara yang sama seperti run_registration().
+
+        Args:
+            registrations (Iterable[Registration]): Daftar pendaftaran.
+            fail_fast (bool): Sama seperti pada run_registration().
+
+        Returns:
+            List[Tuple[bool, List[str]]]: Hasil run_registration() untuk tiap
+                                          pendaftaran, sesuai urutan input.
+        """
+        return [self._run(reg, fail_fast) for reg in registrations]
+
+    def _run(self, registration: Registration, fail_fast: bool) -> Tuple[bool, List[str]]:
+        """Menjalankan validasi dengan memanfaatkan cache hasil."""
+        logger.info("Memulai validasi pendaftaran untuk: %s", registration.student_name)
+
+        # Course di-hash berdasarkan isinya (kode, SKS, prasyarat, jadwal), sehingga
+        # Course berbeda dengan kode yang sama tidak berbagi hasil
+        key = (registration.completed_set, registration.selected_courses, fail_fast)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._run_rules(registration, fail_fast)
+            if self.cache_size > 0:
+                self._cache[key] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+            logger.info("Menggunakan hasil validasi tersimpan.")
+
+        ok, messages = result
+        return ok, list(messages)
+
+    def iter_errors(self, registration: Registration) -> Iterator[str]:
+        """
+        Menjalankan rules satu per satu (termurah lebih dulu) dan menghasilkan
+        pesan error segera setelah rule gagal. Rule berikutnya baru dijalankan
+        ketika pemanggil meminta error selanjutnya, sehingga UI dapat berhenti
+        kapan saja tanpa menjalankan rule yang lebih mahal.
+
+        Args:
+            registration (Registration): Objek data pendaftaran.
+
+        Yields:
+            str: Pesan error dari setiap rule yang gagal.
+        """
         for rule in self.rules:
             ok, msg = rule.validate(registration)
             if not ok:
-                errors.append(msg)
+                yield msg
+
+    def _run_rules(self, registration: Registration,
+                   fail_fast: bool) -> Tuple[bool, Tuple[str, ...]]:
+        """Menjalankan setiap rule dan mengumpulkan pesan error."""
+        # Jalur cepat gabungan tidak menjalankan rule, sehingga log "Memeriksa ..."
+        # dari setiap rule tidak muncul; karena itu hanya dipakai jika INFO mati
+        if not logger.isEnabledFor(logging.INFO):
+            sks_rule = self._fused_sks_rule()
+            if sks_rule is not None and self._fused_validate(registration, sks_rule.max_sks):
+                return True, ("Validasi sukses.",)
+
+        errors = []
+        for msg in self.iter_errors(registration):
+            errors.append(msg)
+            if fail_fast:
+                break
         
         if errors:
-            logger.error(f"Validasi gagal dengan {len(errors)} error.")
-            return False, errors
+            logger.error("Validasi gagal dengan %d error.", len(errors))
+            return False, tuple(errors)
         
         logger.info("Semua validasi berhasil.")
-        return True, ["Validasi sukses."]
+        return True, ("Validasi sukses.",)
+
+    def _fused_sks_rule(self) -> Optional[SksLimitRule]:
+        """
+        Mengembalikan SksLimitRule jika rules persis tiga rule standar (SKS,
+        prasyarat, jadwal bentrok), selain itu None. Diperiksa pada setiap
+        validasi karena self.rules dapat diganti setelah service dibuat.
+        """
+        rules = self.rules
+        standard = {SksLimitRule, PrerequisiteRule, JadwalBentrokRule}
+        if len(rules) != 3 or {type(rule) for rule in rules} != standard:
+            return None
+        return next(rule for rule in rules if isinstance(rule, SksLimitRule))
+
+    def _fused_validate(self, registration: Registration, max_sks: int) -> bool:
+        """
+        Memeriksa batas SKS, prasyarat, dan jadwal bentrok dalam satu kali
+        iterasi selected_courses. Hanya menjawab lolos/gagal; jika gagal,
+        pesan detail disusun oleh masing-masing rule.
+        """
+        if registration.total_sks > max_sks:
+            return False
+
+        completed = registration.completed_set
+        taken = 0
+        for course in registration.selected_courses:
+            mask = course.schedule_mask
+            if (taken & mask or course.has_self_overlap
+                    or not completed.issuperset(course.prerequisites)):
+                return False
+            taken |= mask
+
+        return True
 
 # -------------------------
 # Demo / Main
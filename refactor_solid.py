@@ -1,4 +1,6 @@
 import logging
+import logging.handlers
+import queue
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -17,7 +19,7 @@ LOGGER = logging.getLogger('Checkout')
 # ==========================================
 # MODEL & ABSTRAKSI
 # ==========================================
-@dataclass
+@dataclass(slots=True)
 class Order:
     customer_name: str
     total_price: float
@@ -40,13 +42,14 @@ class INotificationService(ABC):
 # ==========================================
 class CreditCardProcessor(IPaymentProcessor):
     def process(self, order: Order) -> bool:
-        # Kita gunakan print di sini karena ini simulasi proses eksternal
-        print("Payment: Memproses Kartu Kredit.") 
+        # Simulasi proses eksternal dicatat lewat logger (bukan print) agar
+        # tidak menulis langsung ke stdout pada setiap pesanan
+        LOGGER.info("Payment: Memproses Kartu Kredit.")
         return True
 
 class EmailNotifier(INotificationService):
     def send(self, order: Order):
-        print(f"Notif: Mengirim email konfirmasi ke {order.customer_name}.")
+        LOGGER.info("Notif: Mengirim email konfirmasi ke %s.", order.customer_name)
 
 # ==========================================
 # KELAS UTAMA (Target Modifikasi)
@@ -80,7 +83,7 @@ class CheckoutService:
             bool: True jika checkout sukses, False jika gagal.
         """
         # Implementasi Logging (Langkah 2 & 3 - Gambar 1 & 4)
-        LOGGER.info(f"Memulai checkout untuk {order.customer_name}. Total: {order.total_price}")
+        LOGGER.info("Memulai checkout untuk %s. Total: %s", order.customer_name, order.total_price)
 
         payment_success = self.payment_processor.process(order)
 
@@ -100,6 +103,15 @@ class CheckoutService:
 # PROGRAM UTAMA (Main)
 # ==========================================
 if __name__ == "__main__":
+    # Logging lewat antrian: record hanya di-enqueue, penulisan ke handler
+    # asli dilakukan QueueListener di thread terpisah
+    root_logger = logging.getLogger()
+    original_handlers = root_logger.handlers
+    log_queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, *original_handlers)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+
     # Setup Dependencies
     andi_order = Order("Andi", 500000)
     email_service = EmailNotifier()
@@ -108,6 +120,11 @@ if __name__ == "__main__":
     # Injeksi Dependensi
     checkout_service = CheckoutService(payment_processor=cc_processor, notifier=email_service)
     
-    # Jalankan Checkout
-    print("\n--- Log Output ---")
-    checkout_service.run_checkout(andi_order)
\ No newline at end of file
+    # Jalankan Checkout; listener tetap dihentikan (antrian dikosongkan) dan
+    # handler asli dipasang kembali meskipun checkout melempar exception
+    try:
+        print("\n--- Log Output ---")
+        checkout_service.run_checkout(andi_order)
+    finally:
+        listener.stop()
+        root_logger.handlers = original_handlers
\ No newline at end of file
@@ -0,0 +1,161 @@
+import importlib.util
+import logging
+import unittest
+from unittest import mock
+
+from Sistem_Validasi_Registrasi_Mahasiswa import (
+    Course, IValidationRule, JadwalBentrokRule, PrerequisiteRule, Registration, RegistrationService,
+    SksLimitRule,
+)
+
+logging.disable(logging.CRITICAL)
+
+
+class JadwalBentrokRuleTest(unittest.TestCase):
+    def test_bentrok_setelah_slot_mata_kuliah_sendiri_beririsan(self):
+        # C0 punya dua slot yang saling beririsan; C1 bentrok dengan slot
+        # C0 yang lebih panjang (10:30-12:00) tetapi tidak dengan 10:45-11:45.
+        c0 = Course("C0", "", 2, [], [("Senin", 645, 705), ("Senin", 630, 720)])
+        c1 = Course("C1", "", 2, [], [("Senin", 705, 765)])
+        reg = Registration("x", [], [c0, c1])
+
+        ok, _ = JadwalBentrokRule().validate(reg)
+
+        self.assertFalse(ok)
+
+    def test_slot_mata_kuliah_sendiri_beririsan_dianggap_bentrok(self):
+        c0 = Course("C0", "", 2, [], [("Senin", 540, 660), ("Senin", 600, 720)])
+        reg = Registration("x", [], [c0])
+
+        ok, msg = JadwalBentrokRule().validate(reg)
+
+        self.assertFalse(ok)
+        self.assertEqual(msg, "Jadwal bentrok antara C0 (09:00-11:00) dan C0 (10:00-12:00)")
+
+    def test_slot_sampai_tengah_malam_tidak_bentrok_dengan_hari_berikutnya(self):
+        c0 = Course("C0", "", 2, [], [("Senin", 1380, 1440)])
+        c1 = Course("C1", "", 2, [], [("Selasa", 0, 30)])
+        c2 = Course("C2", "", 2, [], [("Senin", 1410, 1440)])
+
+        self.assertTrue(JadwalBentrokRule().validate(Registration("x", [], [c0, c1]))[0])
+        self.assertEqual(JadwalBentrokRule().validate(Registration("x", [], [c0, c2]))[1],
+                         "Jadwal bentrok antara C0 (23:00-24:00) dan C2 (23:30-24:00)")
+
+    @unittest.skipUnless(importlib.util.find_spec("numba"), "numba tidak terinstal")
+    def test_pesan_numba_sama_dengan_versi_python(self):
+        c1 = Course("C1", "", 2, [], [("Senin", 600, 660)])
+        c2 = Course("C2", "", 2, [], [("Senin", 700, 760)])
+        c3 = Course("C3", "", 2, [], [("Senin", 540, 620)])
+        reg = Registration("x", [], [c1, c2, c3])
+
+        self.assertEqual(JadwalBentrokRule(use_numba=True).validate(reg),
+                         JadwalBentrokRule(use_numba=False).validate(reg))
+
+
+class CourseTest(unittest.TestCase):
+    def test_course_immutable_dan_hashable(self):
+        a = Course("A", "", 2, ["X"], [("Senin", 540, 600)])
+        b = Course("A", "", 2, ["X"], [("Senin", 540, 600)])
+
+        self.assertEqual(a.prerequisites, ("X",))
+        self.assertEqual(hash(a), hash(b))
+        with self.assertRaises(AttributeError):
+            a.sks = 30
+
+    def test_rentang_waktu_tidak_valid_ditolak(self):
+        for slot in [("Senin", 600, 600), ("Senin", 660, 540), ("Senin", -30, 60), ("Senin", 1380, 1500)]:
+            with self.subTest(slot=slot), self.assertRaises(ValueError):
+                Course("A", "", 2, [], [slot])
+
+    def test_nama_hari_di_luar_daftar_diterima(self):
+        a = Course("A", "", 2, [], [("Monday", 540, 600)])
+        b = Course("B", "", 2, [], [("senin", 540, 600)])
+        c = Course("C", "", 2, [], [("Monday", 570, 630)])
+
+        self.assertTrue(JadwalBentrokRule().validate(Registration("x", [], [a, b]))[0])
+        self.assertFalse(JadwalBentrokRule().validate(Registration("x", [], [a, c]))[0])
+
+
+class SksLimitRuleTest(unittest.TestCase):
+    def test_total_sks_tidak_bisa_basi(self):
+        reg = Registration("x", [], [Course("A", "", 3, [], [])])
+
+        with self.assertRaises(AttributeError):
+            reg.selected_courses.append(Course("B", "", 30, [], []))
+        self.assertTrue(SksLimitRule(max_sks=24).validate(reg)[0])
+
+
+class RegistrationServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.service = RegistrationService([JadwalBentrokRule(), PrerequisiteRule(), SksLimitRule(max_sks=24)])
+
+    def test_rules_diurutkan_berdasarkan_estimated_cost(self):
+        self.assertIsInstance(self.service.rules, tuple)
+        self.assertEqual([type(rule) for rule in self.service.rules],
+                         [SksLimitRule, PrerequisiteRule, JadwalBentrokRule])
+
+    def test_fail_fast_hanya_pesan_rule_termurah(self):
+        # Gagal di ketiga rule: SKS, prasyarat, dan jadwal bentrok
+        a = Course("A", "", 20, ["X"], [("Rabu", 600, 700)])
+        b = Course("B", "", 20, [], [("Rabu", 630, 730)])
+        reg = Registration("x", [], [a, b])
+
+        ok, messages = self.service.run_registration(reg, fail_fast=True)
+        _, all_messages = self.service.run_registration(reg)
+
+        self.assertFalse(ok)
+        self.assertEqual(messages, ["Total SKS (40) melebihi batas maksimum (24)."])
+        self.assertEqual(len(all_messages), 3)
+        self.assertEqual(all_messages[0], messages[0])
+
+    def test_run_batch_sama_dengan_run_registration(self):
+        # Dua Course berbeda dengan kode yang sama
+        r1 = Registration("a", [], [Course("X", "", 3, [], [])])
+        r2 = Registration("b", [], [Course("X", "", 3, ["P"], [])])
+
+        batch = self.service.run_batch([r1, r2])
+
+        self.assertEqual(batch, [self.service.run_registration(r) for r in (r1, r2)])
+        self.assertFalse(batch[1][0])
+
+    def test_jalur_gabungan_sama_dengan_per_rule(self):
+        a = Course("A", "", 3, [], [("Senin", 540, 600)])
+        b = Course("B", "", 3, ["A0"], [("Selasa", 540, 600)])
+        registrations = [
+            Registration("lolos", ["A0"], [a, b]),
+            Registration("sks", ["A0"], [a, b, Course("C", "", 20, [], [])]),
+            Registration("prasyarat", [], [a, b]),
+            Registration("bentrok", ["A0"], [a, Course("D", "", 2, [], [("Senin", 570, 630)])]),
+            Registration("bentrok sendiri", [], [Course("E", "", 2, [], [("Senin", 540, 660),
+                                                                          ("Senin", 600, 720)])]),
+        ]
+
+        for reg in registrations:
+            errors = list(self.service.iter_errors(reg))
+            for fail_fast in (False, True):
+                if errors:
+                    expected = (False, errors[:1] if fail_fast else errors)
+                else:
+                    expected = (True, ["Validasi sukses."])
+                with self.subTest(reg=reg.student_name, fail_fast=fail_fast):
+                    self.assertEqual(self.service.run_registration(reg, fail_fast=fail_fast), expected)
+
+    def test_jalur_gabungan_tidak_menjalankan_rule_saat_lolos(self):
+        reg = Registration("x", [], [Course("A", "", 3, [], [("Senin", 540, 600)])])
+
+        with mock.patch.object(JadwalBentrokRule, "validate", side_effect=AssertionError):
+            self.assertEqual(self.service.run_registration(reg), (True, ["Validasi sukses."]))
+
+    def test_rules_diperiksa_ulang_setiap_validasi(self):
+        class TolakSemua(IValidationRule):
+            def validate(self, registration):
+                return False, "Ditolak."
+
+        reg = Registration("x", [], [Course("A", "", 3, [], [])])
+        self.service.rules = self.service.rules + (TolakSemua(),)
+
+        self.assertEqual(self.service.run_registration(reg), (False, ["Ditolak."]))
+
+
+if __name__ == "__main__":
+    unittest.main()